@@ -3,23 +3,13 @@ Command Line Interface for data preprocessing operations.
 Groups: clean, numeric, text, struct.
 """
 
-import ast
+# Preprocessing (and NumPy) is imported per command to keep `--help` fast.
+# pylint: disable=import-outside-toplevel
+
+import json
+import os
+import warnings
 import click
-from .preprocessing import (
-    remove_missing,
-    fill_missing,
-    remove_duplicates,
-    normalize,
-    standardize,
-    clip,
-    to_integers,
-    log_transform,
-    tokenize,
-    remove_punctuation,
-    remove_stopwords,
-    flatten,
-    shuffle,
-)
 
 
 @click.group(help="Main CLI group for data preprocessing operations")
@@ -35,6 +25,8 @@ clean = click.Group("clean", help="Data cleaning operations")
 @click.argument("values", nargs=-1)
 def remove_missing_cmd(values: tuple) -> None:
     """Example: cli clean remove-missing 1 None "" nan 2"""
+    from .preprocessing import remove_missing
+
     result = remove_missing(list(values))
     click.echo(result)
 
@@ -46,6 +38,8 @@ def remove_missing_cmd(values: tuple) -> None:
 )
 def fill_missing_cmd(values: tuple, fill_value: float) -> None:
     """Example: cli clean fill-missing 1 None 3 --fill-value 999"""
+    from .preprocessing import fill_missing
+
     result = fill_missing(list(values), fill_value)
     click.echo(result)
 
@@ -57,48 +51,149 @@ cli.add_command(clean)
 numeric = click.Group("numeric", help="Numeric data operations")
 
 
+def _check_npy_suffix(_ctx, _param, value: str | None) -> str | None:
+    """Rejects output paths that np.save would silently suffix with .npy."""
+    if value is not None and not value.endswith(".npy"):
+        raise click.BadParameter("must end with '.npy'.")
+    return value
+
+
+def _array_io(command):
+    """Adds the --input-file/--output-file options shared by array commands."""
+    command = click.option(
+        "--output-file",
+        type=click.Path(dir_okay=False),
+        default=None,
+        callback=_check_npy_suffix,
+        help="Write the result to a .npy file (path must end with .npy)",
+    )(command)
+    return click.option(
+        "--input-file",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help="Read values from a .npy, .csv or .txt file instead of arguments",
+    )(command)
+
+
+def _load_values(values: tuple, input_file: str | None):
+    """Returns the command input as a float64 array (memory-mapped for .npy)."""
+    import numpy as np
+
+    if input_file is None:
+        return np.asarray(values, dtype=np.float64)
+    if values:
+        raise click.UsageError("Pass either VALUES or --input-file, not both.")
+    suffix = os.path.splitext(input_file)[1].lower()
+    try:
+        if suffix == ".npy":
+            arr = np.load(input_file, mmap_mode="r")
+            if np.iscomplexobj(arr):
+                raise ValueError("complex values are not supported")
+            arr = np.asarray(arr, dtype=np.float64)
+        else:
+            delimiter = "," if suffix == ".csv" else None
+            with warnings.catch_warnings():
+                # Empty files are reported below instead of via a UserWarning.
+                warnings.simplefilter("ignore", UserWarning)
+                arr = np.loadtxt(
+                    input_file, dtype=np.float64, delimiter=delimiter, ndmin=1
+                )
+    except (OSError, TypeError, ValueError) as err:
+        raise click.BadParameter(
+            f"cannot read numbers from {input_file!r}: {err}",
+            param_hint="'--input-file'",
+        ) from err
+    if arr.size == 0:
+        raise click.BadParameter(
+            f"{input_file!r} contains no values", param_hint="'--input-file'"
+        )
+    return arr.ravel()
+
+
+def _emit_array(result, input_file: str | None, output_file: str | None) -> None:
+    """Saves to .npy, prints one value per line for file input, else a list."""
+    if output_file is not None:
+        import numpy as np
+
+        np.save(output_file, result)
+    elif input_file is not None:
+        click.echo("\n".join(map(str, result.tolist())))
+    else:
+        click.echo(result.tolist())
+
+
 @numeric.command("normalize", help="Min-max normalization")
 @click.argument("values", nargs=-1, type=float)
 @click.option("--new-min", default=0.0, help="New minimum value")
 @click.option("--new-max", default=1.0, help="New maximum value")
-def normalize_cmd(values: tuple, new_min: float, new_max: float) -> None:
+@_array_io
+def normalize_cmd(
+    values: tuple,
+    new_min: float,
+    new_max: float,
+    input_file: str | None,
+    output_file: str | None,
+) -> None:
     """Example: cli numeric normalize 0 5 10 --new-min 0 --new-max 1"""
-    result = normalize(list(values), new_min, new_max)
-    click.echo(result)
+    from .preprocessing import normalize_np
+
+    result = normalize_np(_load_values(values, input_file), new_min, new_max)
+    _emit_array(result, input_file, output_file)
 
 
 @numeric.command("standardize", help="Z-score standardization")
 @click.argument("values", nargs=-1, type=float)
-def standardize_cmd(values: tuple) -> None:
+@_array_io
+def standardize_cmd(
+    values: tuple, input_file: str | None, output_file: str | None
+) -> None:
     """Example: cli numeric standardize 1 2 3 4 5"""
-    result = standardize(list(values))
-    click.echo(result)
+    from .preprocessing import standardize_np
+
+    result = standardize_np(_load_values(values, input_file))
+    _emit_array(result, input_file, output_file)
 
 
 @numeric.command("clip", help="Clip values to a range")
 @click.argument("values", nargs=-1, type=float)
 @click.option("--min", "min_val", default=0.0, help="Minimum value to clip")
 @click.option("--max", "max_val", default=1.0, help="Maximum value to clip")
-def clip_cmd(values: tuple, min_val: float, max_val: float) -> None:
+@_array_io
+def clip_cmd(
+    values: tuple,
+    min_val: float,
+    max_val: float,
+    input_file: str | None,
+    output_file: str | None,
+) -> None:
     """Example: cli numeric clip 1 2 3 4 5 --min 2 --max 4"""
-    result = clip(list(values), min_val, max_val)
-    click.echo(result)
+    from .preprocessing import clip_np
+
+    result = clip_np(_load_values(values, input_file), min_val, max_val)
+    _emit_array(result, input_file, output_file)
 
 
 @numeric.command("to-integers", help="Convert string numbers to integers")
 @click.argument("values", nargs=-1)
 def to_integers_cmd(values: tuple) -> None:
     """Example: cli numeric to-integers "1.5" "2" "abc" """
+    from .preprocessing import to_integers
+
     result = to_integers(list(values))
     click.echo(result)
 
 
 @numeric.command("log-transform", help="Apply log to positive values")
 @click.argument("values", nargs=-1, type=float)
-def log_transform_cmd(values: tuple) -> None:
+@_array_io
+def log_transform_cmd(
+    values: tuple, input_file: str | None, output_file: str | None
+) -> None:
     """Example: cli numeric log-transform 1 10 100"""
-    result = log_transform(list(values))
-    click.echo(result)
+    from .preprocessing import log_transform_np
+
+    result = log_transform_np(_load_values(values, input_file))
+    _emit_array(result, input_file, output_file)
 
 
 cli.add_command(numeric)
@@ -114,6 +209,8 @@ text_group = click.Group(
 @click.argument("text", type=str)
 def tokenize_cmd(text: str) -> None:
     """Example: cli text tokenize "Hello, World! 123" """
+    from .preprocessing import tokenize
+
     result = tokenize(text)
     click.echo(result)
 
@@ -124,6 +221,8 @@ def tokenize_cmd(text: str) -> None:
 @click.argument("text", type=str)
 def remove_punctuation_cmd(text: str) -> None:
     """Example: cli text remove-punctuation "Hello, world!" """
+    from .preprocessing import remove_punctuation
+
     result = remove_punctuation(text)
     click.echo(result)
 
@@ -133,6 +232,8 @@ def remove_punctuation_cmd(text: str) -> None:
 @click.option("--stopwords", multiple=True, default=[], help="Stopwords to remove")
 def remove_stopwords_cmd(text: str, stopwords: tuple) -> None:
     """Example: cli text remove-stopwords "this is a test" --stopwords "is" --stopwords "a" """
+    from .preprocessing import remove_stopwords
+
     result = remove_stopwords(text, list(stopwords))
     click.echo(result)
 
@@ -149,6 +250,8 @@ struct = click.Group("struct", help="Data structure operations")
 @click.option("--seed", type=int, default=None, help="Random seed for reproducibility")
 def shuffle_cmd(values: tuple, seed: int | None) -> None:
     """Example: cli struct shuffle 1 2 3 4 5 --seed 42"""
+    from .preprocessing import shuffle
+
     result = shuffle(list(values), seed)
     click.echo(result)
 
@@ -157,14 +260,14 @@ def shuffle_cmd(values: tuple, seed: int | None) -> None:
 @click.argument("values", nargs=-1)
 def flatten_cmd(values: tuple) -> None:
     """Example: cli struct flatten "[1,2]" "[3,4]" """
+    from .preprocessing import flatten
+
     try:
         list_of_lists = [
-            ast.literal_eval(v)
-            for v in values
-            if isinstance(v, str) and v.startswith("[")
+            json.loads(v) for v in values if isinstance(v, str) and v.startswith("[")
         ]
         result = flatten(list_of_lists)
-    except Exception:  # pylint: disable=broad-except
+    except (json.JSONDecodeError, RecursionError):
         result = []
     click.echo(result)
 
@@ -173,6 +276,8 @@ def flatten_cmd(values: tuple) -> None:
 @click.argument("values", nargs=-1)
 def unique_cmd(values: tuple) -> None:
     """Example: cli struct unique 1 2 2 3 1"""
+    from .preprocessing import remove_duplicates
+
     result = remove_duplicates(list(values))
     click.echo(result)
 
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
 import pytest
 from click.testing import CliRunner
 from src.cli import cli
@@ -53,7 +57,95 @@ def test_cli_struct_flatten(runner):
     assert result.exit_code == 0
     assert "[1, 2, 3, 4]" in result.output
 
+def test_cli_struct_flatten_invalid(runner):
+    result = runner.invoke(cli, ['struct', 'flatten', '[1,2]', '[3,'])
+    assert result.exit_code == 0
+    assert "[]" in result.output
+    nested = '[' * 5000 + ']' * 5000
+    result = runner.invoke(cli, ['struct', 'flatten', nested])
+    assert result.exit_code == 0
+    assert "[]" in result.output
+
 def test_cli_struct_unique(runner):
     result = runner.invoke(cli, ['struct', 'unique', '1', '2', '2', '3', '1'])
     assert result.exit_code == 0
-    assert "['1', '2', '3']" in result.output or "[1, 2, 3]" in result.output
\ No newline at end of file
+    assert "['1', '2', '3']" in result.output or "[1, 2, 3]" in result.output
+
+def test_cli_help_does_not_import_preprocessing():
+    code = (
+        "import sys; from src.cli import cli; "
+        "assert 'src.preprocessing' not in sys.modules; "
+        "assert 'numpy' not in sys.modules"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
+
+def test_cli_numeric_input_file(runner, tmp_path):
+    csv_file = tmp_path / "values.csv"
+    csv_file.write_text("0,5\n10,5\n")
+    result = runner.invoke(cli, ['numeric', 'normalize', '--input-file', str(csv_file)])
+    assert result.exit_code == 0
+    assert result.output.split() == ['0.0', '0.5', '1.0', '0.5']
+
+def test_cli_numeric_npy_round_trip(runner, tmp_path):
+    in_file, out_file = tmp_path / "in.npy", tmp_path / "out.npy"
+    np.save(in_file, np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+    result = runner.invoke(cli, [
+        'numeric', 'clip', '--min', '2', '--max', '4',
+        '--input-file', str(in_file), '--output-file', str(out_file)
+    ])
+    assert result.exit_code == 0
+    assert np.load(out_file).tolist() == [2.0, 2.0, 3.0, 4.0, 4.0]
+
+def test_cli_numeric_input_file_with_values(runner, tmp_path):
+    txt_file = tmp_path / "values.txt"
+    txt_file.write_text("1 2 3\n")
+    result = runner.invoke(cli, ['numeric', 'standardize', '1', '--input-file', str(txt_file)])
+    assert result.exit_code != 0
+    assert "not both" in result.output
+
+def test_cli_numeric_input_file_errors(runner, tmp_path):
+    header_csv = tmp_path / "header.csv"
+    header_csv.write_text("value\n1\n")
+    result = runner.invoke(cli, ['numeric', 'clip', '--input-file', str(header_csv)])
+    assert result.exit_code == 2
+    assert "cannot read numbers" in result.output
+    upper_csv = tmp_path / "values.CSV"
+    upper_csv.write_text("1,2,3\n")
+    result = runner.invoke(cli, ['numeric', 'clip', '--input-file', str(upper_csv)])
+    assert result.exit_code == 0
+    assert result.output.split() == ['1.0', '1.0', '1.0']
+    structured = tmp_path / "structured.npy"
+    np.save(structured, np.zeros(3, dtype=[('a', 'i4'), ('b', 'f8')]))
+    complex_npy = tmp_path / "complex.npy"
+    np.save(complex_npy, np.array([1 + 2j, 3.0]))
+    empty_csv = tmp_path / "empty.csv"
+    empty_csv.write_text("")
+    for path in (structured, complex_npy, empty_csv):
+        result = runner.invoke(cli, ['numeric', 'clip', '--input-file', str(path)])
+        assert result.exit_code == 2, result.output
+        assert "--input-file" in result.output
+    result = runner.invoke(cli, [
+        'numeric', 'clip', '1', '--output-file', str(tmp_path / "out.bin")
+    ])
+    assert result.exit_code == 2
+    assert "must end with '.npy'" in result.output
+
+def test_cli_numeric_npy_and_csv_share_code_path(runner, tmp_path, monkeypatch):
+    from src import preprocessing
+    monkeypatch.setattr(preprocessing, "_KERNEL_MIN_SIZE", 1)
+    values = np.random.default_rng(0).normal(1e6, 1.0, 1000)
+    npy_file, csv_file = tmp_path / "in.npy", tmp_path / "in.csv"
+    np.save(npy_file, values)
+    np.savetxt(csv_file, values, fmt="%.17g")
+    outputs = []
+    for in_file in (npy_file, csv_file):
+        out_file = tmp_path / f"out_{in_file.suffix[1:]}.npy"
+        result = runner.invoke(cli, [
+            'numeric', 'standardize',
+            '--input-file', str(in_file), '--output-file', str(out_file)
+        ])
+        assert result.exit_code == 0
+        outputs.append(np.load(out_file))
+    assert np.array_equal(outputs[0], outputs[1])
+
@@ -2,9 +2,17 @@ import pytest
 from src.preprocessing import (
     remove_missing, fill_missing, remove_duplicates, normalize,
     standardize, clip, to_integers, log_transform, tokenize,
-    remove_punctuation, remove_stopwords, flatten, shuffle
+    remove_punctuation, remove_stopwords, flatten, shuffle,
+    normalize_np, standardize_np, clip_np, log_transform_np,
+    clip_normalize_standardize, clip_normalize_standardize_np,
+    remove_stopwords_stream
 )
 import math
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+import random
 
 # === FIXTURE ===
 @pytest.fixture
@@ -35,6 +43,7 @@ def test_fill_missing(values, fill_value, expected):
 # === OTRAS PRUEBAS UNITARIAS ===
 def test_remove_missing():
     assert remove_missing([1, None, '', 'nan', 2]) == [1, 2]
+    assert remove_missing([float("nan"), "NaN", "None", 0, 3.5]) == [0, 3.5]
 
 def test_normalize(sample_numbers):
     result = normalize(sample_numbers)
@@ -47,16 +56,76 @@ def test_standardize(sample_numbers):
     expected = [(x - 3.0) / std_dev for x in sample_numbers]
     assert [round(r, 6) for r in result] == [round(e, 6) for e in expected]
 
+@pytest.mark.parametrize("values", [[], [7.0]])
+def test_numeric_degenerate_inputs(values):
+    assert normalize(values, 2.0, 3.0) == [2.0] * len(values)
+    assert standardize(values) == [0.0] * len(values)
+    assert normalize_np(np.array(values), 2.0, 3.0).tolist() == [2.0] * len(values)
+    assert standardize_np(np.array(values)).tolist() == [0.0] * len(values)
+    assert clip(values, 0.0, 5.0) == [min(v, 5.0) for v in values]
+    assert clip(np.array(values), 0.0, 5.0) == [min(v, 5.0) for v in values]
+
 def test_clip(sample_numbers):
     assert clip(sample_numbers, 2, 4) == [2, 2, 3, 4, 4]
+    assert clip(sample_numbers, 4, 2) == [4, 4, 4, 4, 4]
+    assert clip(np.array([1.0, 2.0, 3.0]), 0, 2) == [1.0, 2.0, 2.0]
+    assert math.isnan(clip([1.0, float("nan"), 3.0], 0, 2)[1])
+
+def test_ndarray_variants(sample_numbers):
+    arr = np.array(sample_numbers)
+    arr.setflags(write=False)
+    for func, list_func, args in [
+        (normalize_np, normalize, ()),
+        (standardize_np, standardize, ()),
+        (clip_np, clip, (2, 4)),
+        (log_transform_np, log_transform, ()),
+    ]:
+        result = func(arr, *args)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == list_func(sample_numbers, *args)
+    assert arr.tolist() == sample_numbers
+
+@pytest.mark.parametrize("lo, hi, new_min, new_max", [
+    (2, 4, 0, 1),
+    (0, 10, 5, -5),
+    (0, 10, 3, 3),
+    (6, 9, 0, 1),
+])
+def test_clip_normalize_standardize(sample_numbers, lo, hi, new_min, new_max):
+    expected = standardize(normalize(clip(sample_numbers, lo, hi), new_min, new_max))
+    result = clip_normalize_standardize(sample_numbers, lo, hi, new_min, new_max)
+    assert np.allclose(result, expected)
+    assert clip_normalize_standardize([], lo, hi) == []
+
+@pytest.mark.parametrize("lo, hi, new_min, new_max", [
+    (-1, 1, 0, 1),
+    (-1, 1, 5, -5),
+    (-1, 1, 3, 3),
+    (4, 9, 0, 1),
+])
+def test_clip_normalize_standardize_kernel_path(lo, hi, new_min, new_max, monkeypatch):
+    pytest.importorskip("numba")
+    from src import preprocessing
+    arr = np.random.default_rng(0).normal(size=1000)
+    expected = standardize_np(normalize_np(clip_np(arr, lo, hi), new_min, new_max))
+    monkeypatch.setattr(preprocessing, "_KERNEL_MIN_SIZE", 1)
+    assert preprocessing._kernels_for(arr) is not None
+    result = clip_normalize_standardize_np(arr, lo, hi, new_min, new_max)
+    assert np.allclose(result, expected)
 
 def test_to_integers():
     assert to_integers(["1", "2.5", "abc", "3", "4.0"]) == [1, 2, 3, 4]
+    assert to_integers([" -7 ", ".5e1", "1e400", "nan", "1.2.3", 8.9, None]) == [-7, 5, 8]
 
 def test_log_transform():
     result = log_transform([1, math.e, math.e**2])
     assert [round(r, 6) for r in result] == [0.0, 1.0, 2.0]
 
+def test_log_transform_keep_zeros():
+    assert log_transform([0, -1, 10]) == [math.log(10)]
+    result = log_transform([0, -1, 10], keep_zeros=True)
+    assert [round(r, 6) for r in result] == [0.0, round(math.log(10), 6)]
+
 def test_tokenize():
     text = "Hello, World! This is 2025."
     assert tokenize(text) == ["hello", "world", "this", "is", "2025"]
@@ -64,11 +133,19 @@ def test_tokenize():
 def test_remove_punctuation():
     text = "Hello, world! How are you???"
     assert remove_punctuation(text) == "Hello  world  How are you   "
+    assert remove_punctuation("café\u2014ok\u00a0!") == "caf  ok\u00a0 "
 
 def test_remove_stopwords():
     text = "This is a sample text"
     stopwords = ["is", "a"]
     assert remove_stopwords(text, stopwords) == "this sample text"
+    assert remove_stopwords(text, ["IS", "A"]) == "this sample text"
+
+def test_remove_stopwords_stream():
+    lines = iter(["This is a\n", "sample TEXT is\n"])
+    kept = remove_stopwords_stream(lines, ["is", "a"])
+    assert next(kept) == "this"
+    assert " ".join(kept) == "sample text"
 
 def test_flatten():
     assert flatten([[1, 2], [3, 4], [5]]) == [1, 2, 3, 4, 5]
@@ -79,4 +156,60 @@ def test_shuffle():
     assert len(shuffled) == 5
     assert set(shuffled) == {1, 2, 3, 4, 5}
     # Same seed → same result
-    assert shuffle(values, seed=42) == shuffled
\ No newline at end of file
+    assert shuffle(values, seed=42) == shuffled
+
+def test_shuffle_does_not_reseed_global_rng():
+    state = random.getstate()
+    shuffle([1, 2, 3], seed=0)
+    assert random.getstate() == state
+
+def test_numba_kernels_match_numpy():
+    pytest.importorskip("numba")
+    from src._kernels import clip_kernel, standardize_kernel
+    arr = np.random.default_rng(0).normal(size=257)
+    assert np.allclose(standardize_kernel(arr), (arr - arr.mean()) / arr.std())
+    assert np.allclose(clip_kernel(arr, -0.5, 0.5), np.clip(arr, -0.5, 0.5))
+
+@pytest.mark.parametrize("offset", [1e6, -3e7])
+def test_standardize_kernel_large_offset(offset):
+    pytest.importorskip("numba")
+    from src import preprocessing
+    size = preprocessing._KERNEL_MIN_SIZE
+    arr = np.random.default_rng(0).normal(offset, 1.0, size)
+    assert preprocessing._kernels_for(arr) is not None
+    mean = math.fsum(arr) / size
+    std = math.sqrt(math.fsum((arr - mean) ** 2) / size)
+    error = np.abs(standardize_np(arr) - (arr - mean) / std).max()
+    assert error <= 2 * np.spacing(abs(offset)) / std
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("values", [
+    [1.0, float("nan"), 3.0],
+    [1.0, float("inf"), 3.0],
+    [-float("inf"), 1.0, float("inf")],
+])
+def test_numba_kernels_match_numpy_on_non_finite(values, monkeypatch):
+    pytest.importorskip("numba")
+    from src import preprocessing
+    arr = np.array(values)
+    arr.setflags(write=False)  # like a memory-mapped .npy input
+    for func, args in [
+        (standardize_np, ()),
+        (clip_np, (0.0, 2.0)),
+        (clip_np, (2.0, 0.0)),
+        (clip_normalize_standardize_np, (0.0, 2.0, 0.0, 1.0)),
+    ]:
+        monkeypatch.setattr(preprocessing, "_KERNEL_MIN_SIZE", 1)
+        assert preprocessing._kernels_for(arr) is not None
+        kernel_result = func(arr, *args)
+        monkeypatch.setattr(preprocessing, "_KERNEL_MIN_SIZE", arr.size + 1)
+        np.testing.assert_allclose(kernel_result, func(arr, *args))
+
+def test_preprocessing_imports_numba_lazily():
+    code = (
+        "import sys; from src.preprocessing import standardize; "
+        "standardize([1.0, 2.0, 3.0]); "
+        "assert 'numba' not in sys.modules"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)